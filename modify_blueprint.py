@@ -10,15 +10,18 @@ import sys
 import os
 import json
 import argparse
+import functools
 import re
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add dspbptk to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'dspbptk'))
 
-from Blueprint import Blueprint
-from BlueprintData import BlueprintData
-
 # Import translation functions from translate_names.py
 from translate_names import (
     setup_translation,
@@ -29,6 +32,16 @@ from translate_names import (
 )
 
 
+def load_json_file(path):
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 def translate_text(text, translator):
     """
     Translate Chinese text in a blueprint description to English.
@@ -53,7 +66,7 @@ def translate_text(text, translator):
     return translated
 
 
-def translate_blueprint_file(input_file, output_file=None, ignore_corrupt=False, dry_run=False, translator=None, quiet=False):
+def translate_blueprint_file(input_file, output_file=None, ignore_corrupt=False, dry_run=False, translator=None, quiet=False, bp=None):
     """
     Translate Chinese text in a blueprint's short_desc and long_desc to English.
 
@@ -64,28 +77,24 @@ def translate_blueprint_file(input_file, output_file=None, ignore_corrupt=False,
         dry_run: Show what would be changed without writing
         translator: Pre-initialized translator (optional, for batch processing)
         quiet: Suppress verbose output
+        bp: Blueprint already read from input_file (optional, avoids reading the file twice)
     """
     if output_file is None:
         output_file = input_file
 
-    # Setup translation if not provided
-    if translator is None:
-        if not quiet:
-            print("Setting up translation...")
-        translator = setup_translation()
-        if not quiet:
-            print("Translation ready.\n")
-
     # Read the blueprint
-    if not quiet:
-        print(f"Reading blueprint from: {input_file}")
+    if bp is None:
+        from Blueprint import Blueprint
 
-    try:
-        bp = Blueprint.read_from_file(input_file, validate_hash=not ignore_corrupt)
-    except Exception as e:
         if not quiet:
-            print(f"Error reading blueprint: {e}")
-        return False
+            print(f"Reading blueprint from: {input_file}")
+
+        try:
+            bp = Blueprint.read_from_file(input_file, validate_hash=not ignore_corrupt)
+        except Exception as e:
+            if not quiet:
+                print(f"Error reading blueprint: {e}")
+            return False
 
     # Get current descriptions
     old_short = bp.short_desc
@@ -95,6 +104,14 @@ def translate_blueprint_file(input_file, output_file=None, ignore_corrupt=False,
         print(f"\nOriginal short description: {old_short}")
         print(f"Original long description:\n{old_long}\n")
 
+    # Setup translation only if provided text actually needs it
+    if translator is None and (contains_chinese(old_short) or contains_chinese(old_long)):
+        if not quiet:
+            print("Setting up translation...")
+        translator = setup_translation()
+        if not quiet:
+            print("Translation ready.\n")
+
     # Translate
     new_short = translate_text(old_short, translator)
     new_long = translate_text(old_long, translator)
@@ -137,6 +154,7 @@ def translate_all_blueprints(directory, ignore_corrupt=False, dry_run=False):
         dry_run: Show what would be changed without writing
     """
     import glob
+    from Blueprint import Blueprint
 
     directory = Path(directory).resolve()
 
@@ -151,10 +169,8 @@ def translate_all_blueprints(directory, ignore_corrupt=False, dry_run=False):
     print(f"Found {total} blueprint files to process.")
     print(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}\n")
 
-    # Setup translation once
-    print("Setting up translation...")
-    translator = setup_translation()
-    print("Translation ready.\n")
+    # Setup translation once, on the first blueprint that needs it
+    translator = None
 
     translated_count = 0
     error_count = 0
@@ -179,13 +195,19 @@ def translate_all_blueprints(directory, ignore_corrupt=False, dry_run=False):
                         print(f"[{i}/{total}] Progress... ({translated_count} translated, {skipped_count} skipped, {error_count} errors)")
                     continue
 
+            if translator is None and (contains_chinese(short_desc) or contains_chinese(long_desc)):
+                print("Setting up translation...")
+                translator = setup_translation()
+                print("Translation ready.\n")
+
             # Translate
             result = translate_blueprint_file(
                 filepath,
                 ignore_corrupt=ignore_corrupt,
                 dry_run=dry_run,
                 translator=translator,
-                quiet=True
+                quiet=True,
+                bp=bp
             )
 
             if result:
@@ -253,6 +275,8 @@ def modify_blueprint_file(input_file, output_file, modifications=None,
         long_desc: New long description (optional)
         ignore_corrupt: Skip hash validation (optional)
     """
+    from Blueprint import Blueprint
+
     # Read the blueprint
     print(f"Reading blueprint from: {input_file}")
     bp = Blueprint.read_from_file(input_file, validate_hash=not ignore_corrupt)
@@ -280,6 +304,34 @@ def modify_blueprint_file(input_file, output_file, modifications=None,
     print("Done!")
 
 
+@functools.lru_cache(maxsize=None)
+def _bp2json_action():
+    """Return a bp2json action class that runs directly from parsed args (defined once)."""
+    from ActionBlueprintToJSON import ActionBlueprintToJSON
+
+    class _BP2JsonAction(ActionBlueprintToJSON):
+        def __init__(self, args):
+            self._cmd = 'bp2json'
+            self._args = args
+            self.run()
+
+    return _BP2JsonAction
+
+
+@functools.lru_cache(maxsize=None)
+def _json2bp_action():
+    """Return a json2bp action class that runs directly from parsed args (defined once)."""
+    from ActionJSONToBlueprint import ActionJSONToBlueprint
+
+    class _Json2BpAction(ActionJSONToBlueprint):
+        def __init__(self, args):
+            self._cmd = 'json2bp'
+            self._args = args
+            self.run()
+
+    return _Json2BpAction
+
+
 def convert_to_json(input_file, output_file, pretty_print=False, ignore_corrupt=False):
     """
     Convert a blueprint file to JSON format for easier inspection/modification.
@@ -293,8 +345,6 @@ def convert_to_json(input_file, output_file, pretty_print=False, ignore_corrupt=
     print(f"Converting blueprint to JSON: {input_file} -> {output_file}")
     
     # Use dspbptk's built-in JSON conversion via command-line interface
-    from ActionBlueprintToJSON import ActionBlueprintToJSON
-    
     args = argparse.Namespace(
         infile=input_file,
         outfile=output_file,
@@ -304,14 +354,7 @@ def convert_to_json(input_file, output_file, pretty_print=False, ignore_corrupt=
         verbose=0
     )
     
-    # Create action instance properly
-    class ActionWrapper(ActionBlueprintToJSON):
-        def __init__(self, args):
-            self._cmd = 'bp2json'
-            self._args = args
-            self.run()
-    
-    ActionWrapper(args)
+    _bp2json_action()(args)
     print("Done!")
 
 
@@ -325,7 +368,6 @@ def convert_from_json(input_file, output_file, ignore_corrupt=False):
         ignore_corrupt: Skip validation
     """
     print(f"Converting JSON to blueprint: {input_file} -> {output_file}")
-    from ActionJSONToBlueprint import ActionJSONToBlueprint
     
     args = argparse.Namespace(
         infile=input_file,
@@ -335,13 +377,7 @@ def convert_from_json(input_file, output_file, ignore_corrupt=False):
         verbose=0
     )
     
-    class ActionWrapper(ActionJSONToBlueprint):
-        def __init__(self, args):
-            self._cmd = 'json2bp'
-            self._args = args
-            self.run()
-    
-    ActionWrapper(args)
+    _json2bp_action()(args)
     print("Done!")
 
 
@@ -353,16 +389,14 @@ def dump_blueprint_info(input_file, ignore_corrupt=False):
         input_file: Path to blueprint file
         ignore_corrupt: Skip hash validation
     """
-    from ActionDump import ActionDump
     import collections
+    from Blueprint import Blueprint
     from Enums import DysonSphereItem
     
     bp = Blueprint.read_from_file(input_file, validate_hash=not ignore_corrupt)
     bpd = bp.decoded_data
     
-    building_counter = collections.Counter()
-    for building in bpd.buildings:
-        building_counter[building.data.item_id] += 1
+    building_counter = collections.Counter(building.data.item_id for building in bpd.buildings)
     
     if bp.short_desc != "":
         print("Text          : %s" % (bp.short_desc))
@@ -370,12 +404,10 @@ def dump_blueprint_info(input_file, ignore_corrupt=False):
         print("Description   : %s" % (bp.long_desc))
     print("Game version  : %s" % (bp.game_version))
     print("Building count: %d" % (len(bpd.buildings)))
+    items_by_id = DysonSphereItem._value2member_map_
     for (item_id, count) in building_counter.most_common():
-        try:
-            item = DysonSphereItem(item_id)
-            item_name = item.name
-        except ValueError:
-            item_name = f"[{item_id}]"
+        item = items_by_id.get(item_id)
+        item_name = item.name if item is not None else f"[{item_id}]"
         print("%5d  %s" % (count, item_name))
 
 
@@ -445,8 +477,7 @@ def main():
         if args.command == 'modify':
             modifications = None
             if args.modifications:
-                with open(args.modifications, 'r') as f:
-                    modifications = json.load(f)
+                modifications = load_json_file(args.modifications)
             
             modify_blueprint_file(
                 args.input,
@@ -9,15 +9,15 @@ import os
 import sys
 import re
 import argparse
+import functools
 from pathlib import Path
 
-try:
-    import argostranslate.package
-    import argostranslate.translate
-except ImportError:
-    print("Error: argostranslate not installed.")
-    print("Install with: pip install argostranslate")
-    sys.exit(1)
+# Precompiled patterns used on every file/folder name in the walk
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+_CJK_RUN_RE = re.compile(r'[\u4e00-\u9fff]+')
+_CN_PUNCT_RE = re.compile(r'[（）【】「」『』、，。：；""''！？　＆＝＋]')
+_CLEANUP_RE = re.compile(r'(\s+)|[^\w\-.]')  # whitespace runs -> dash, other symbols dropped
+_DASHES_RE = re.compile(r'-+')
 
 
 # Official Dyson Sphere Program Chinese → English mappings
@@ -288,6 +288,15 @@ DSP_DICTIONARY = {
 
 def setup_translation():
     """Download and install Chinese to English translation package if needed."""
+    # Imported here since Argos pulls in the whole model runtime, which most runs never need
+    try:
+        import argostranslate.package
+        import argostranslate.translate
+    except ImportError:
+        print("Error: argostranslate not installed.")
+        print("Install with: pip install argostranslate")
+        sys.exit(1)
+
     from_code = "zh"
     to_code = "en"
 
@@ -318,110 +327,165 @@ def setup_translation():
         argostranslate.package.install_from_path(package_to_install.download())
         print("Package installed successfully.")
 
-    return argostranslate.translate.get_translation_from_codes(from_code, to_code)
+    return CachedTranslator(argostranslate.translate.get_translation_from_codes(from_code, to_code))
+
+
+class CachedTranslator:
+    """
+    Wrap an Argos translator so each distinct Chinese fragment is only translated once.
+    Blueprint folders share many of the same names, and neural inference is by far the slowest step.
+    """
+
+    def __init__(self, translator):
+        self._translator = translator
+        self._cache = {}
+
+    def translate(self, text):
+        result = self._cache.get(text)
+        if result is None:
+            result = self._translator.translate(text)
+            self._cache[text] = result
+        return result
+
+    def warm_cache(self, texts):
+        """
+        Translate fragments up front so later lookups are served from the cache.
+        Each distinct fragment is still one Argos call; this only moves the work ahead of the renames.
+        """
+        for text in dict.fromkeys(texts):
+            self.translate(text)
+
+
+class _FragmentCollector:
+    """
+    Stand-in translator that records the distinct fragments Argos would be asked for.
+    Lets a whole directory be scanned first so the fragments can be translated before any rename.
+    """
+
+    def __init__(self):
+        # Used as an ordered set, so each fragment is translated exactly once
+        self.pending = {}
+
+    def translate(self, text):
+        self.pending[text] = None
+        return text
 
 
+@functools.lru_cache(maxsize=4096)
 def contains_chinese(text):
     """Check if text contains Chinese characters."""
-    return bool(re.search(r'[\u4e00-\u9fff]', text))
+    # isascii() is O(1) on CPython and rules out most names before the regex runs
+    return not text.isascii() and _CJK_RE.search(text) is not None
 
 
 def needs_translation(text):
     """Check if text contains Chinese characters or Chinese punctuation that needs normalization."""
+    if text.isascii():
+        return False
     # Chinese characters
-    if re.search(r'[\u4e00-\u9fff]', text):
+    if _CJK_RE.search(text):
         return True
     # Chinese/fullwidth punctuation
-    if re.search(r'[（）【】「」『』、，。：；""''！？　＆＝＋]', text):
+    if _CN_PUNCT_RE.search(text):
         return True
     return False
 
 
-def extract_chinese_segments(text):
-    """Extract Chinese character sequences from text with their positions."""
-    return [(m.group(), m.start(), m.end()) for m in re.finditer(r'[\u4e00-\u9fff]+', text)]
+# Marks the end of a dictionary term in the trie, never a single Chinese character
+_TERM_END = '$'
+
+
+def _build_trie(dictionary):
+    """Build a character trie of dictionary terms, one nested dict per character."""
+    trie = {}
+    for term, replacement in dictionary.items():
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[_TERM_END] = replacement
+    return trie
+
+
+_TRIE = _build_trie(DSP_DICTIONARY)
+
+
+def _find_terms_trie(run):
+    """Return (start, end, replacement) for the longest dictionary term at each position, left to right."""
+    matches = []
+    i = 0
+    n = len(run)
+
+    while i < n:
+        # Follow the trie as far as the run allows, remembering the longest complete term
+        node = _TRIE
+        match_end = -1
+        replacement = None
+        j = i
+        while j < n:
+            node = node.get(run[j])
+            if node is None:
+                break
+            j += 1
+            if _TERM_END in node:
+                match_end = j
+                replacement = node[_TERM_END]
+
+        if match_end < 0:
+            i += 1
+        else:
+            matches.append((i, match_end, replacement))
+            i = match_end
+
+    return matches
+
+
+def _translate_chinese_run(run, translator):
+    """
+    Translate a run of Chinese characters.
+    Replaces the longest dictionary term at each position and sends the leftover stretches to Argos.
+    """
+    parts = []
+    last_end = 0
+
+    for start, end, replacement in _find_terms_trie(run):
+        if start > last_end:
+            parts.append(_translate_fragment(run[last_end:start], translator))
+        parts.append(replacement)
+        last_end = end
+
+    if last_end < len(run):
+        parts.append(_translate_fragment(run[last_end:], translator))
+
+    return ''.join(parts)
 
 
 def translate_with_dictionary(chinese_text, translator):
     """
     Translate Chinese text using DSP dictionary first, falling back to Argos.
     Uses longest match first to handle compound terms correctly.
+    Non-Chinese text is preserved as-is.
     """
-    # Sort dictionary keys by length (longest first) for greedy matching
-    sorted_terms = sorted(DSP_DICTIONARY.keys(), key=len, reverse=True)
-
-    result = chinese_text
-    matched_ranges = []
-
-    # First pass: find all dictionary matches (longest first)
-    for term in sorted_terms:
-        start = 0
-        while True:
-            idx = result.find(term, start)
-            if idx == -1:
-                break
+    parts = []
+    last_end = 0
 
-            end = idx + len(term)
-            # Check if this range overlaps with already matched ranges
-            overlaps = any(
-                not (end <= m_start or idx >= m_end)
-                for m_start, m_end, _ in matched_ranges
-            )
-
-            if not overlaps:
-                matched_ranges.append((idx, end, DSP_DICTIONARY[term]))
-
-            start = idx + 1
-
-    # Sort matches by position
-    matched_ranges.sort(key=lambda x: x[0])
-
-    # Build result by replacing matched ranges and translating unmatched Chinese
-    if matched_ranges:
-        parts = []
-        last_end = 0
-
-        for start, end, replacement in matched_ranges:
-            # Add text before this match
-            before = result[last_end:start]
-            if before:
-                # Translate any remaining Chinese in the gap
-                if contains_chinese(before):
-                    before = translate_remaining_chinese(before, translator)
-                parts.append(before)
-
-            parts.append(replacement)
-            last_end = end
-
-        # Add remaining text after last match
-        after = result[last_end:]
-        if after:
-            if contains_chinese(after):
-                after = translate_remaining_chinese(after, translator)
-            parts.append(after)
-
-        return ''.join(parts)
-    else:
-        # No dictionary matches, use Argos translation
-        return translate_remaining_chinese(result, translator)
+    for match in _CJK_RUN_RE.finditer(chinese_text):
+        parts.append(chinese_text[last_end:match.start()])
+        parts.append(_translate_chinese_run(match.group(), translator))
+        last_end = match.end()
 
+    parts.append(chinese_text[last_end:])
+    return ''.join(parts)
 
-def translate_remaining_chinese(text, translator):
-    """Translate any remaining Chinese characters using Argos."""
-    segments = extract_chinese_segments(text)
-    if not segments:
-        return text
 
-    result = text
-    # Process in reverse order to preserve positions
-    for chinese, start, end in reversed(segments):
-        translated = translator.translate(chinese)
-        translated = translated.strip()
-        translated = re.sub(r'\s+', '-', translated)
-        translated = re.sub(r'[^\w\-.]', '', translated)
-        result = result[:start] + translated + result[end:]
+def _cleanup_replacement(match):
+    """Replace a whitespace run with a dash and drop any other symbol."""
+    return '-' if match.group(1) else ''
+
 
-    return result
+def _translate_fragment(chinese, translator):
+    """Translate a single Chinese fragment with Argos and make it filename-safe."""
+    translated = translator.translate(chinese).strip()
+    return _CLEANUP_RE.sub(_cleanup_replacement, translated)
 
 
 # Known file extensions to preserve
@@ -485,14 +549,26 @@ def translate_name(name, translator):
     translated_stem = translate_with_dictionary(stem, translator)
 
     # Clean up the result
-    translated_stem = re.sub(r'-+', '-', translated_stem)  # Remove multiple dashes
+    translated_stem = _DASHES_RE.sub('-', translated_stem)  # Remove multiple dashes
     translated_stem = translated_stem.strip('-')  # Remove leading/trailing dashes
 
     return translated_stem + suffix
 
 
-def rename_item(old_path, new_name, dry_run=False):
-    """Rename a file or directory."""
+def _exists(path, dir_fd=None):
+    """Check whether path exists, relative to dir_fd if given."""
+    try:
+        os.stat(path, dir_fd=dir_fd)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
+
+
+def rename_item(old_path, new_name, dry_run=False, dir_fd=None):
+    """
+    Rename a file or directory.
+    If dir_fd is given, old_path is relative to that open directory.
+    """
     old_path = Path(old_path)
     new_path = old_path.parent / new_name
 
@@ -500,11 +576,11 @@ def rename_item(old_path, new_name, dry_run=False):
         return None
 
     # Handle name conflicts
-    if new_path.exists():
+    if _exists(new_path, dir_fd):
         counter = 1
         stem = new_path.stem if new_path.suffix else new_name
         suffix = new_path.suffix
-        while new_path.exists():
+        while _exists(new_path, dir_fd):
             new_name = f"{stem}_{counter}{suffix}"
             new_path = old_path.parent / new_name
             counter += 1
@@ -512,40 +588,56 @@ def rename_item(old_path, new_name, dry_run=False):
     if dry_run:
         print(f"  [DRY RUN] {old_path.name} -> {new_name}")
     else:
-        os.rename(old_path, new_path)
+        os.rename(old_path, new_path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
         print(f"  Renamed: {old_path.name} -> {new_name}")
 
     return new_path
 
 
-def translate_directory(root_dir, translator, dry_run=False):
+# Directories never descended into or renamed
+SKIP_DIRS = ('.git', '.venv')
+
+# Rename through an open fd of the parent directory where the platform supports it (not Windows),
+# so the kernel doesn't resolve the full path again for every rename
+_USE_DIR_FD = (
+    os.open in os.supports_dir_fd
+    and os.stat in os.supports_dir_fd
+    and os.rename in os.supports_dir_fd
+)
+
+
+def _walk(path, visit):
+    """
+    Call visit(dirpath, name) for every entry below path whose name needs translation.
+    Children are visited before their parent directory, so renaming in visit order never invalidates a recorded path.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError as e:
+        # Like os.walk, skip directories that can't be listed rather than aborting the run
+        print(f"  Skipping unreadable directory {path}: {e.strerror}")
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS:
+            _walk(entry.path, visit)
+        # Pure ASCII names can't contain Chinese, skip them before any regex work
+        if not entry.name.isascii() and needs_translation(entry.name):
+            visit(path, entry.name)
+
+
+def translate_directory(root_dir, translator=None, dry_run=False):
     """
     Recursively translate all file and folder names in a directory.
     Processes depth-first to handle nested renames correctly.
+    If translator is None, Argos is only set up when some name needs more than the dictionary.
     """
     root_dir = Path(root_dir).resolve()
 
-    # Collect all items first (to avoid issues with renaming during iteration)
+    # Collect (parent directory, name) pairs, already in bottom-up order
     items_to_process = []
-
-    for dirpath, dirnames, filenames in os.walk(root_dir, topdown=False):
-        dirpath = Path(dirpath)
-
-        # Skip .git and .venv directories
-        if '.git' in dirpath.parts or '.venv' in dirpath.parts:
-            continue
-
-        # Process files first
-        for filename in filenames:
-            if needs_translation(filename):
-                items_to_process.append(('file', dirpath / filename))
-
-        # Then directories
-        for dirname in dirnames:
-            if dirname in ('.git', '.venv'):
-                continue
-            if needs_translation(dirname):
-                items_to_process.append(('dir', dirpath / dirname))
+    _walk(os.fspath(root_dir), lambda dirpath, name: items_to_process.append((dirpath, name)))
 
     if not items_to_process:
         print("No files or folders with Chinese names found.")
@@ -553,19 +645,51 @@ def translate_directory(root_dir, translator, dry_run=False):
 
     print(f"Found {len(items_to_process)} items to translate.\n")
 
-    # Process items (already in bottom-up order from os.walk)
+    # Gather every fragment the dictionary can't handle and translate them up front
+    collector = _FragmentCollector()
+    for name in dict.fromkeys(name for _, name in items_to_process):
+        translate_name(name, collector)
+
+    if collector.pending:
+        if translator is None:
+            print("Setting up translation...")
+            translator = setup_translation()
+            print("Translation ready.\n")
+
+        print(f"Translating {len(collector.pending)} unique fragments with Argos...\n")
+        translator.warm_cache(collector.pending)
+
+    # Rename bottom-up, every translation is now served from the cache
     renamed_count = 0
-    for item_type, item_path in items_to_process:
-        if not item_path.exists():
-            # Path may have changed due to parent directory rename
-            continue
+    parent = None
+    dir_fd = None
+    try:
+        for dirpath, name in items_to_process:
+            new_name = translate_name(name, translator)
+            if name == new_name:
+                continue
 
-        old_name = item_path.name
-        new_name = translate_name(old_name, translator)
+            if not _USE_DIR_FD:
+                rename_item(os.path.join(dirpath, name), new_name, dry_run)
+                renamed_count += 1
+                continue
 
-        if old_name != new_name:
-            rename_item(item_path, new_name, dry_run)
-            renamed_count += 1
+            # Siblings are mostly adjacent, so each parent is usually opened once
+            if dirpath != parent:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+                    dir_fd = None
+                parent = dirpath
+                try:
+                    dir_fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY)
+                except OSError as e:
+                    print(f"  Skipping unreadable directory {dirpath}: {e.strerror}")
+            if dir_fd is not None:
+                rename_item(name, new_name, dry_run, dir_fd)
+                renamed_count += 1
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
     print(f"\n{'Would rename' if dry_run else 'Renamed'} {renamed_count} items.")
 
@@ -597,11 +721,7 @@ def main():
     print(f"Mode: {'DRY RUN' if args.dry_run else 'LIVE'}")
     print(f"Using {len(DSP_DICTIONARY)} DSP-specific term mappings\n")
 
-    print("Setting up translation...")
-    translator = setup_translation()
-    print("Translation ready.\n")
-
-    translate_directory(root_dir, translator, args.dry_run)
+    translate_directory(root_dir, None, args.dry_run)
 
 
 if __name__ == "__main__":